@@ -12,19 +12,50 @@ from flake8.options.manager import OptionManager
 
 LOG = logging.getLogger(__name__)
 
+# the boolean spellings accepted by ``ConfigParser.getboolean``
+TRUE_VALUES = frozenset(("1", "yes", "true", "on"))
+FALSE_VALUES = frozenset(("0", "no", "false", "off"))
+
+# absolute path => (st_mtime_ns, st_size, parsed config)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, configparser.RawConfigParser]] = {}
+
+
+def _read_config(path: str) -> Optional[configparser.RawConfigParser]:
+    """Parse the config file at ``path``, reusing an earlier parse if possible.
+
+    The parsed configuration is cached until the file's modification time or
+    size changes.  The returned parser is shared and must not be modified.
+    Returns ``None`` if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    key = os.path.abspath(path)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
 
-def _find_config_file(path: str) -> Optional[str]:
     cfg = configparser.RawConfigParser()
+    cfg.read(path)
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, cfg)
+    return cfg
+
+
+def _find_config_file(path: str) -> Optional[str]:
     while True:
         for candidate in ("setup.cfg", "tox.ini", ".flake8"):
             cfg_path = os.path.join(path, candidate)
             try:
-                cfg.read(cfg_path)
+                cfg = _read_config(cfg_path)
             except (UnicodeDecodeError, configparser.ParsingError) as e:
                 LOG.warning("ignoring unparseable config %s: %s", cfg_path, e)
             else:
                 # only consider it a config if it contains flake8 sections
-                if "flake8" in cfg or "flake8:local-plugins" in cfg:
+                if cfg is not None and (
+                    "flake8" in cfg or "flake8:local-plugins" in cfg
+                ):
                     return cfg_path
 
         new_path = os.path.dirname(path)
@@ -49,8 +80,11 @@ def load_config(
     - if a config file is given in ``config`` use that, otherwise attempt to
       discover a configuration using ``tox.ini`` / ``setup.cfg`` / ``.flake8``
     - finally, load any ``extra`` configuration files
+
+    The returned configuration may be shared with later calls and must not
+    be modified.
     """
-    pwd = os.path.abspath(".")
+    pwd = os.getcwd()
 
     if isolated:
         return configparser.RawConfigParser(), pwd
@@ -58,13 +92,21 @@ def load_config(
     if config is None:
         config = _find_config_file(pwd)
 
-    cfg = configparser.RawConfigParser()
     if config is not None:
-        cfg.read(config)
         cfg_dir = os.path.dirname(config)
     else:
         cfg_dir = pwd
 
+    # without extra files we can reuse the parse made during discovery
+    if config is not None and not extra:
+        cached = _read_config(config)
+        if cached is not None:
+            return cached, cfg_dir
+
+    cfg = configparser.RawConfigParser()
+    if config is not None:
+        cfg.read(config)
+
     # TODO: remove this and replace it with configuration modifying plugins
     # read the additional configs afterwards
     for filename in extra:
@@ -73,31 +115,43 @@ def load_config(
     return cfg, cfg_dir
 
 
+def _parse_boolean(value: str) -> bool:
+    folded = value.lower()
+    if folded in TRUE_VALUES:
+        return True
+    elif folded in FALSE_VALUES:
+        return False
+    else:
+        raise ValueError(f"Not a boolean: {value}")
+
+
 def parse_config(
     option_manager: OptionManager,
     cfg: configparser.RawConfigParser,
     cfg_dir: str,
 ) -> Dict[str, Any]:
     """Parse and normalize the typed configuration options."""
-    if "flake8" not in cfg:
+    try:
+        items = cfg.items("flake8", raw=True)
+    except configparser.NoSectionError:
         return {}
 
     config_dict = {}
 
-    for option_name in cfg["flake8"]:
+    for option_name, raw_value in items:
         option = option_manager.config_options_dict.get(option_name)
         if option is None:
             LOG.debug('Option "%s" is not registered. Ignoring.', option_name)
             continue
 
-        # Use the appropriate method to parse the config value
+        # Convert the value as ConfigParser's getint / getboolean would
         value: Any
-        if option.type is int or option.action == "count":
-            value = cfg.getint("flake8", option_name)
-        elif option.action in {"store_true", "store_false"}:
-            value = cfg.getboolean("flake8", option_name)
+        if option.config_type == "int":
+            value = int(raw_value)
+        elif option.config_type == "bool":
+            value = _parse_boolean(raw_value)
         else:
-            value = cfg.get("flake8", option_name)
+            value = raw_value
 
         LOG.debug('Option "%s" returned value: %r', option_name, value)
 
@@ -39,6 +39,23 @@ _optparse_callable_map: Dict[str, Union[Type[Any], _ARG]] = {
     "str": str,
 }
 
+# the attributes of an Option which are keyword arguments to ``add_argument``
+_OPTION_KWARGS = (
+    "action",
+    "default",
+    "type",
+    "dest",
+    "nargs",
+    "const",
+    "choices",
+    "callback",
+    "callback_args",
+    "callback_kwargs",
+    "help",
+    "metavar",
+    "required",
+)
+
 
 class _CallbackAction(argparse.Action):
     """Shim for optparse-style callback actions."""
@@ -96,9 +113,43 @@ def _flake8_normalize(
     return ret
 
 
+def _config_type_for(type_: Any, action: Any) -> str:
+    if type_ is int or action == "count":
+        return "int"
+    elif action in {"store_true", "store_false"}:
+        return "bool"
+    else:
+        return "str"
+
+
 class Option:
     """Our wrapper around an argparse argument parsers to add features."""
 
+    __slots__ = (
+        "short_option_name",
+        "long_option_name",
+        "option_args",
+        "action",
+        "default",
+        "type",
+        "dest",
+        "nargs",
+        "const",
+        "choices",
+        "callback",
+        "callback_args",
+        "callback_kwargs",
+        "help",
+        "metavar",
+        "required",
+        "parse_from_config",
+        "comma_separated_list",
+        "normalize_paths",
+        "config_name",
+        "config_type",
+        "_opt",
+    )
+
     def __init__(
         self,
         short_option_name: Union[str, _ARG] = _ARG.NO,
@@ -251,24 +302,11 @@ class Option:
         self.help = help
         self.metavar = metavar
         self.required = required
-        self.option_kwargs: Dict[str, Union[Any, _ARG]] = {
-            "action": self.action,
-            "default": self.default,
-            "type": self.type,
-            "dest": self.dest,
-            "nargs": self.nargs,
-            "const": self.const,
-            "choices": self.choices,
-            "callback": self.callback,
-            "callback_args": self.callback_args,
-            "callback_kwargs": self.callback_kwargs,
-            "help": self.help,
-            "metavar": self.metavar,
-            "required": self.required,
-        }
 
         # Set our custom attributes
         self.parse_from_config = parse_from_config
+        # how a value read from config is converted: "int", "bool" or "str"
+        self.config_type = _config_type_for(self.type, self.action)
         self.comma_separated_list = comma_separated_list
         self.normalize_paths = normalize_paths
 
@@ -283,12 +321,20 @@ class Option:
 
         self._opt = None
 
+    @property
+    def option_kwargs(self) -> Dict[str, Union[Any, _ARG]]:
+        """Return all arguments which are passed through to argparse."""
+        return {k: getattr(self, k) for k in _OPTION_KWARGS}
+
     @property
     def filtered_option_kwargs(self) -> Dict[str, Any]:
         """Return any actually-specified arguments."""
-        return {
-            k: v for k, v in self.option_kwargs.items() if v is not _ARG.NO
-        }
+        kwargs = {}
+        for k in _OPTION_KWARGS:
+            v = getattr(self, k)
+            if v is not _ARG.NO:
+                kwargs[k] = v
+        return kwargs
 
     def __repr__(self) -> str:  # noqa: D105
         parts = []
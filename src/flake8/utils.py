@@ -50,6 +50,11 @@ def parse_comma_separated_list(
     """
     assert isinstance(value, str), value
 
+    # most values hold a single item, which does not need splitting
+    if regexp.search(value) is None:
+        value = value.strip()
+        return [value] if value else []
+
     separated = regexp.split(value)
     item_gen = (item.strip() for item in separated)
     return [item for item in item_gen if item]
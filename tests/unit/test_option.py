@@ -33,6 +33,13 @@ def test_to_argparse_creates_an_option_as_we_expect():
     assert kwargs == {"action": "count"}
 
 
+def test_option_kwargs_includes_unset_arguments():
+    """Show that option_kwargs still lists every argparse argument."""
+    opt = manager.Option("-t", "--test", action="count")
+    assert opt.option_kwargs["action"] == "count"
+    assert opt.option_kwargs["default"] is manager._ARG.NO
+
+
 def test_config_name_generation():
     """Show that we generate the config name deterministically."""
     opt = manager.Option(
@@ -53,3 +60,21 @@ def test_dest_is_not_overridden():
     """Show that we do not override custom destinations."""
     opt = manager.Option("-s", "--short", dest="something_not_short")
     assert opt.dest == "something_not_short"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    (
+        ({}, "str"),
+        ({"type": int}, "int"),
+        ({"type": "int"}, "int"),
+        ({"action": "count"}, "int"),
+        ({"action": "store_true"}, "bool"),
+        ({"action": "store_false"}, "bool"),
+        ({"type": int, "comma_separated_list": True}, "str"),
+    ),
+)
+def test_config_type(kwargs, expected):
+    """Show that we pick how to convert config values based on the option."""
+    opt = manager.Option("--test", parse_from_config=True, **kwargs)
+    assert opt.config_type == expected
@@ -65,6 +65,44 @@ def test_find_config_searches_upwards(tmp_path):
     assert config._find_config_file(str(subdir)) == str(expected)
 
 
+def test_find_config_stops_at_nearest_config(tmp_path, caplog):
+    subdir = tmp_path.joinpath("d")
+    subdir.mkdir()
+
+    expected = subdir.joinpath("tox.ini")
+    expected.write_text("[flake8]")
+    # a parent config is never read once a nearer one is found
+    tmp_path.joinpath("setup.cfg").write_text("[error")
+
+    assert config._find_config_file(str(subdir)) == str(expected)
+    assert caplog.record_tuples == []
+
+
+def test_read_config_missing_file_returns_none(tmp_path):
+    assert config._read_config(str(tmp_path.joinpath("setup.cfg"))) is None
+
+
+def test_read_config_reuses_unchanged_parse(tmp_path):
+    cfg_path = tmp_path.joinpath("setup.cfg")
+    cfg_path.write_text("[flake8]\nindent-size=2\n")
+
+    cfg = config._read_config(str(cfg_path))
+    assert config._read_config(str(cfg_path)) is cfg
+
+
+def test_read_config_reparses_modified_file(tmp_path):
+    cfg_path = tmp_path.joinpath("setup.cfg")
+    cfg_path.write_text("[flake8]\nindent-size=2\n")
+    cfg = config._read_config(str(cfg_path))
+
+    cfg_path.write_text("[flake8]\nindent-size=10\n")
+    new_cfg = config._read_config(str(cfg_path))
+
+    assert new_cfg is not None
+    assert new_cfg is not cfg
+    assert new_cfg.get("flake8", "indent-size") == "10"
+
+
 def test_load_config_config_specified_skips_discovery(tmpdir):
     tmpdir.join("setup.cfg").write("[flake8]\nindent-size=2\n")
     custom_cfg = tmpdir.join("custom.cfg")
@@ -87,6 +125,22 @@ def test_load_config_no_config_file_does_discovery(tmpdir):
     assert cfg_dir == str(tmpdir)
 
 
+def test_load_config_reuses_discovered_config(tmpdir):
+    tmpdir.join("setup.cfg").write("[flake8]\nindent-size=2\n")
+
+    with tmpdir.as_cwd():
+        cfg, _ = config.load_config(None, [], isolated=False)
+
+    assert cfg is config._read_config(str(tmpdir.join("setup.cfg")))
+
+
+def test_load_config_missing_config_file_is_empty(tmpdir):
+    with tmpdir.as_cwd():
+        cfg, _ = config.load_config("missing.cfg", [], isolated=False)
+
+    assert cfg.sections() == []
+
+
 def test_load_config_no_config_found_sets_cfg_dir_to_pwd(tmpdir):
     with tmpdir.as_cwd():
         cfg, cfg_dir = config.load_config(None, [], isolated=False)
@@ -149,6 +203,31 @@ def test_parse_config_typed_values(tmp_path, opt_manager):
     }
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (("true", True), ("On", True), ("1", True), ("NO", False), ("0", False)),
+)
+def test_parse_config_boolean_values(tmp_path, opt_manager, value, expected):
+    cfg = configparser.RawConfigParser()
+    cfg.add_section("flake8")
+    cfg.set("flake8", "hang_closing", value)
+
+    ret = config.parse_config(opt_manager, cfg, str(tmp_path))
+    assert ret == {"hang_closing": expected}
+
+
+@pytest.mark.parametrize(
+    ("option", "value"), (("hang_closing", "wat"), ("indent_size", "wat"))
+)
+def test_parse_config_invalid_values(tmp_path, opt_manager, option, value):
+    cfg = configparser.RawConfigParser()
+    cfg.add_section("flake8")
+    cfg.set("flake8", option, value)
+
+    with pytest.raises(ValueError):
+        config.parse_config(opt_manager, cfg, str(tmp_path))
+
+
 def test_parse_config_ignores_unknowns(tmp_path, opt_manager, caplog):
     cfg = configparser.RawConfigParser()
     cfg.add_section("flake8")
@@ -28,6 +28,7 @@ RELATIVE_PATHS = ["flake8", "pep8", "pyflakes", "mccabe"]
         ("E123, W234,, E206,,", ["E123", "W234", "E206"]),
         ("E123,,W234,,E206,,", ["E123", "W234", "E206"]),
         ("", []),
+        ("E123", ["E123"]),
     ],
 )
 def test_parse_comma_separated_list(value, expected):
@@ -35,6 +36,22 @@ def test_parse_comma_separated_list(value, expected):
     assert utils.parse_comma_separated_list(value) == expected
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("  ./local  ", ["./local"]),
+        ("   ", []),
+        ("a b,\tc", ["a b", "c"]),
+    ],
+)
+def test_parse_comma_separated_list_custom_regexp(value, expected):
+    """Verify that a single item is stripped with any regexp."""
+    assert (
+        utils.parse_comma_separated_list(value, utils.LOCAL_PLUGIN_LIST_RE)
+        == expected
+    )
+
+
 @pytest.mark.parametrize(
     ("value", "expected"),
     (